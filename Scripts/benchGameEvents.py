@@ -0,0 +1,97 @@
+# %% Imports
+
+import sys
+import time
+from pathlib import Path
+
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pandas as pd
+
+from statcast.database.gd_game_events import DB
+
+
+# %% Previous DataFrame.append based parser, kept for comparison
+
+def appendParseFile(self, file, itemKey):
+
+    rowDict1 = dict.fromkeys(self._tblDTypes.keys(), np.nan)
+
+    tree = ET.parse(file)
+    root = tree.getroot()
+    innings = root.findall('inning')
+    rowDict1[self._itemKeyName] = itemKey
+    df = pd.DataFrame()
+    for inning in innings:
+        rowDict1['inning'] = inning.get('num')
+        for innHalf in inning:
+            if innHalf.tag == 'top':
+                rowDict1['inning_topbot'] = 'top'
+            else:
+                rowDict1['inning_topbot'] = 'bot'
+            for entry in innHalf:
+                rowDict2 = rowDict1.copy()
+                rowDict2['entry'] = entry.tag
+                rowDict2['tfs'] = entry.attrib.pop('start_tfs', np.nan)
+                rowDict2['tfs_zulu'] = \
+                    entry.attrib.pop('start_tfs_zulu', np.nan)
+                rowDict2['events'] = \
+                    '::'.join(entry.attrib.pop(key)
+                              for key in sorted(tuple(entry.attrib.keys()))
+                              if 'event' in key and
+                              not key.endswith(('_es', '_num')))
+                rowDict2['events_es'] = \
+                    '::'.join(entry.attrib.pop(key)
+                              for key in sorted(tuple(entry.attrib.keys()))
+                              if 'event' in key and
+                              key.endswith('_es'))
+                rowDict2.update(entry.attrib)
+                pitches = entry.findall('pitch')
+                if entry.tag == 'atbat' and len(pitches) > 0:
+                    for pitch in pitches:
+                        rowDict3 = rowDict2.copy()
+                        rowDict3['pitch_des'] = \
+                            pitch.attrib.pop('des', np.nan)
+                        rowDict3['pitch_des_es'] = \
+                            pitch.attrib.pop('des_es', np.nan)
+                        rowDict3.update(pitch.attrib)
+                        df = df.append(pd.DataFrame(rowDict3, index=(0,)),
+                                       ignore_index=True)
+                else:
+                    df = df.append(pd.DataFrame(rowDict2, index=(0,)),
+                                   ignore_index=True)
+
+    df.replace('', np.nan, inplace=True)
+    return df
+
+
+# %% Parse a corpus of saved game_events.xml files with both parsers
+
+corpusDir = Path(sys.argv[1] if len(sys.argv) > 1 else 'game_events')
+files = sorted(corpusDir.glob('**/*.xml'))
+if not files:
+    raise FileNotFoundError('No xml files found in {}'.format(corpusDir))
+
+db = DB.__new__(DB)
+times = {'append': [], 'iterparse': []}
+
+for ii, path in enumerate(files):
+    t0 = time.perf_counter()
+    old = appendParseFile(db, str(path), ii)
+    t1 = time.perf_counter()
+    new = db._parseFile(str(path), ii)
+    t2 = time.perf_counter()
+
+    times['append'].append(t1 - t0)
+    times['iterparse'].append(t2 - t1)
+    if not old.equals(new):
+        print('Parsers disagree on {}'.format(path))
+
+# %% Report per-game parse times
+
+for name, ts in times.items():
+    print('{:>9}: {} games, {:.4f} s/game mean, {:.4f} s/game median'.
+          format(name, len(ts), np.mean(ts), np.median(ts)))
+print('Speedup: {:.1f}x'.format(np.sum(times['append']) /
+                                np.sum(times['iterparse'])))
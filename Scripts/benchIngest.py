@@ -0,0 +1,278 @@
+# %% Imports
+
+import os
+import sys
+import time
+import random
+import tempfile
+import datetime as dt
+import threading
+from functools import lru_cache
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from statcast.database import gd_scoreboards, gd_weather, gd_game_events, \
+    bbsavant, scoreboard as gdScoreboard
+from statcast.database.gdcrawler import GdCrawler
+
+
+# %% Synthetic season, shaped like a real one
+
+seasonStart = dt.date(2016, 4, 3)
+seasonDays = 183
+seasonGames = 2430
+nDays = int(sys.argv[1]) if len(sys.argv) > 1 else seasonDays
+teams = bbsavant._venues
+rowCap = bbsavant.DB._rowCap
+
+games = {}
+for ii in range(seasonGames):
+    d = seasonStart + dt.timedelta(ii * seasonDays // seasonGames)
+    home = teams[ii % len(teams)]
+    away = teams[(ii * 7 + 1) % len(teams)]
+    if away == home:
+        away = teams[(ii + 1) % len(teams)]
+    gid = '{}_{}mlb_{}mlb_1'.format(d.strftime('%Y_%m_%d'),
+                                    away.lower().ljust(3, 'x'),
+                                    home.lower().ljust(3, 'x'))
+    games.setdefault(d, []).append((400000 + ii, gid, home, away))
+
+
+def gameDate(path):
+    parts = dict(part.split('_', 1) for part in path.split('/')
+                 if part.startswith(('year_', 'month_', 'day_')))
+    return dt.date(int(parts['year']), int(parts['month']), int(parts['day']))
+
+
+@lru_cache(maxsize=None)
+def scoreboard(d):
+    return ('<games>{}</games>'.format(''.join(
+        '<game game_pk="{}" gameday="{}" home_name_abbrev="{}" '
+        'away_name_abbrev="{}" game_type="R" venue="{} Park">'
+        '<status status="Final"/></game>'.format(pk, gid, home, away, home)
+        for (pk, gid, home, away) in games.get(d, ())))).encode()
+
+
+def pitches(pk):
+    '''Yield (inning, half, atbat, pitch) tuples, ~290 pitches per game'''
+
+    rng = random.Random(pk)
+    for inning in range(1, 10):
+        for half in ('top', 'bottom'):
+            for atbat in range(rng.randint(3, 6)):
+                for pitch in range(rng.randint(1, 7)):
+                    yield (inning, half, atbat, pitch)
+
+
+@lru_cache(maxsize=64)
+def gameEvents(pk):
+    rng = random.Random('gameEvents{}'.format(pk))
+    out = ['<game>']
+    eventNum = 0
+    last = None
+    for (inning, half, atbat, pitch) in pitches(pk):
+        if last is not None and last[:3] != (inning, half, atbat):
+            out.append('</atbat>')
+        if last is None or last[:2] != (inning, half):
+            if last is not None:
+                out.append('</{}>'.format(last[1]))
+            if half == 'top':
+                if last is not None:
+                    out.append('</inning>')
+                out.append('<inning num="{}">'.format(inning))
+            out.append('<{}>'.format(half))
+        if pitch == 0:
+            eventNum += 1
+            out.append(
+                '<atbat num="{}" b="1" s="2" o="1" start_tfs="{}" '
+                'start_tfs_zulu="2016-04-03T17:00:00Z" batter="{}" '
+                'pitcher="{}" des="Batter grounds out." event_num="{}" '
+                'event="Groundout" event_es="Roletazo" play_guid="{}-{}">'.
+                format(atbat, 170000 + eventNum, 500000 + atbat,
+                       600000 + inning, eventNum, pk, eventNum))
+        eventNum += 1
+        out.append(
+            '<pitch sv_id="160403_{:06d}" des="Ball" des_es="Bola" '
+            'type="B" start_speed="{:.1f}" pitch_type="FF" '
+            'event_num="{}"/>'.format(eventNum, rng.uniform(80, 100),
+                                      eventNum))
+        last = (inning, half, atbat)
+    out.append('</atbat></{}></inning></game>'.format(last[1]))
+    return ''.join(out).encode()
+
+
+@lru_cache(maxsize=64)
+def plays(pk):
+    rng = random.Random(pk)
+    return ('<game status_ind="F"><score ar="3" hr="4"/>'
+            '<weather condition="{}" temp="{}" wind="{} mph, Out to CF"/>'
+            '<players>{}</players></game>'.format(
+                rng.choice(('Clear', 'Cloudy', 'Sunny')),
+                rng.randint(45, 95), rng.randint(0, 20),
+                ''.join('<player id="{}" pos="P"/>'.format(ii)
+                        for ii in range(2000)))).encode()
+
+
+savantColumns = list(bbsavant.DB._tblDTypes)
+
+
+@lru_cache(maxsize=16)
+def savantRows(d):
+    rows = []
+    for (pk, gid, home, away) in games.get(d, ()):
+        rng = random.Random('savant{}'.format(pk))
+        for (ii, (inning, half, atbat, pitch)) in enumerate(pitches(pk)):
+            row = []
+            for col in savantColumns:
+                sqlType = bbsavant.DB._tblDTypes[col]
+                if col == 'game_pk':
+                    row.append(str(pk))
+                elif col == 'game_date':
+                    row.append(d.isoformat())
+                elif col == 'pitch_id':
+                    row.append(str(ii))
+                elif col == 'game_year':
+                    row.append(str(d.year))
+                elif col == 'home_team':
+                    row.append(home)
+                elif col == 'away_team':
+                    row.append(away)
+                elif col == 'inning':
+                    row.append(str(inning))
+                elif col == 'inning_topbot':
+                    row.append('Top' if half == 'top' else 'Bot')
+                elif sqlType is bbsavant._string:
+                    row.append('FF')
+                elif sqlType is bbsavant._integer:
+                    row.append(str(pitch))
+                elif sqlType is bbsavant._date:
+                    row.append(d.isoformat())
+                else:
+                    row.append('{:.3f}'.format(rng.uniform(-2, 2)))
+            rows.append((home, ','.join(row)))
+    return rows
+
+
+def savant(query):
+    start = dt.date.fromisoformat(query['game_date_gt'][0])
+    end = dt.date.fromisoformat(query['game_date_lt'][0])
+    venue = query.get('stadium', [''])[0]
+    lines = [','.join(savantColumns)]
+    for ii in range((end - start).days + 1):
+        lines.extend(row for (home, row) in
+                     savantRows(start + dt.timedelta(ii))
+                     if not venue or home == venue)
+    return '\n'.join(lines[:rowCap + 1]).encode()
+
+
+# %% Local gd2/Savant stand-in
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        body = None
+        if url.path.startswith('/savant'):
+            body = savant(parse_qs(url.query, keep_blank_values=True))
+        elif url.path.endswith('master_scoreboard.xml'):
+            d = gameDate(url.path)
+            if d in games:
+                body = scoreboard(d)
+        elif url.path.endswith(('game_events.xml', 'plays.xml')):
+            gid = url.path.rsplit('/', 2)[1][len('gid_'):]
+            pk = next((pk for (pk, g, home, away) in
+                       games.get(gameDate(url.path), ()) if g == gid), None)
+            if pk is not None:
+                body = gameEvents(pk) if url.path.endswith(
+                    'game_events.xml') else plays(pk)
+
+        if body is None:
+            self.send_response(404)
+            body = b''
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+stubRoot = 'http://127.0.0.1:{}/'.format(server.server_port)
+gdURL = stubRoot + 'gd/year_{yyyy}/month_{mm}/day_{dd}/{}'
+savantURL = stubRoot + 'savant?' + bbsavant._baseURL.split('?', 1)[1]
+
+
+# %% SQLite databases routed through the stand-in
+
+workDir = tempfile.mkdtemp(prefix='benchIngest')
+os.chdir(workDir)
+seasonEnd = seasonStart + dt.timedelta(nDays)
+
+
+def benchDB(DB, baseURL):
+
+    def _init0(self):
+        # Only load progress, the timed _update below does the ingest
+        self._loadProgress()
+
+    return type('Bench' + DB.__module__.rsplit('.', 1)[1], (DB,),
+                dict(dbName='benchIngest_' + DB.__module__.rsplit('.', 1)[1],
+                     _username=None, _password=None, _host=None, _port=None,
+                     _drivername='sqlite', startDate=seasonStart,
+                     _baseURL=baseURL, _init0=_init0))
+
+
+def report(name, dbs, elapsed):
+    nGames = sum(len(db.itemKeys) for db in dbs)
+    nRows = sum(db.metrics.totals().get('write', {}).get('rows', 0)
+                for db in dbs)
+    print('{:>16}: {:6d} games {:8d} rows in {:7.2f} s, '
+          '{:7.1f} games/s {:9.0f} rows/s'.
+          format(name, nGames, nRows, elapsed, nGames / elapsed,
+                 nRows / elapsed))
+
+
+# %% Drive _update for each database
+
+print('{} days, {} games, work directory {}'.format(
+    nDays, sum(len(games.get(seasonStart + dt.timedelta(ii), ()))
+               for ii in range(nDays)), workDir))
+
+for module, baseURL in ((gd_scoreboards, gdURL), (gd_weather, gdURL),
+                        (gd_game_events, gdURL), (bbsavant, savantURL)):
+    db = benchDB(module.DB, baseURL)()
+    gdScoreboard.clearGames()
+    t0 = time.perf_counter()
+    db._update(seasonStart, seasonEnd, deferIndexes=True)
+    report(module.__name__.rsplit('.', 1)[1], [db],
+           time.perf_counter() - t0)
+
+# %% Weather and game events together through one gd traversal
+
+dbs = [benchDB(module.DB, gdURL)(fast=True)
+       for module in (gd_weather, gd_game_events)]
+for db in dbs:
+    db.dbName += '_crawler'
+    db.engine.execute('DELETE FROM "{}"'.format(db._tblName))
+    db.engine.execute('DELETE FROM "{}"'.format(db._itemTblName))
+    db.engine.execute('DELETE FROM "{}"'.format(db._doneTblName))
+    db._loadProgress()
+    db.lastUpdate = seasonStart
+
+gdScoreboard.clearGames()
+t0 = time.perf_counter()
+GdCrawler(dbs).update(seasonEnd)
+report('crawler', dbs, time.perf_counter() - t0)
+
+server.shutdown()
+print(pd.Series(sorted(os.listdir(os.path.join(workDir, 'reports'))),
+                name='run reports'))
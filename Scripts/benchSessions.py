@@ -0,0 +1,105 @@
+# %% Imports
+
+import time
+import datetime
+import threading
+from statistics import median
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from statcast.database import scoreboard as gdScoreboard
+from statcast.database.gd_weather import DB as WeatherDB
+
+
+# %% Stub gd2 server
+
+nGames = 15
+nDays = 5
+nRuns = 3
+handshake = 0.03    # seconds per new connection, like TCP + TLS over a WAN
+latency = 0.005     # seconds per request
+
+scoreboard = '<games>{}</games>'.format(''.join(
+    '<game game_pk="{0}" gameday="2016_04_0{1}_aaamlb_bbbmlb_1">'
+    '<status status="Final"/></game>'.format(ii, ii % 9 + 1)
+    for ii in range(nGames))).encode()
+plays = (b'<game><weather condition="Clear" temp="72" wind="5 mph"/>' +
+         b'<players/>' * 2000 + b'</game>')
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        time.sleep(handshake)
+        super().setup()
+
+    def do_GET(self):
+        time.sleep(latency)
+        if self.path.endswith('master_scoreboard.xml'):
+            body = scoreboard
+        else:
+            body = plays
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+stubURL = 'http://127.0.0.1:{}/'.format(server.server_port) + \
+    'year_{yyyy}/month_{mm}/day_{dd}/{}'
+
+
+# %% Databases routed through the stub, with and without pooling
+
+class PooledDB(WeatherDB):
+
+    dbName = 'benchSessions'
+    _username = None
+    _password = None
+    _host = None
+    _port = None
+    _drivername = 'sqlite'
+    _baseURL = stubURL
+    startDate = datetime.date.today()
+
+
+class UnpooledDB(PooledDB):
+
+    def _request(self, url):
+        r = requests.get(url, timeout=self._timeout)
+        return (r.status_code, r.content)
+
+
+# %% Time a few days of fetching and parsing, alternating the two runs
+
+dates = [datetime.date(2016, 4, 1) + datetime.timedelta(ii)
+         for ii in range(nDays)]
+
+rates = {DB: [] for DB in (UnpooledDB, PooledDB)}
+for run in range(nRuns):
+    for DB in rates:
+        db = DB()
+        gdScoreboard.clearGames()
+        t0 = time.perf_counter()
+        nItems = sum(len(db._getItems(d)[1]) for d in dates)
+        elapsed = time.perf_counter() - t0
+        rates[DB].append(nItems / elapsed)
+
+print('{:.0f} ms per new connection, {:.0f} ms per request, median of {} runs'.
+      format(handshake * 1e3, latency * 1e3, nRuns))
+for DB, rate in rates.items():
+    print('{:>10}: {:.1f} games/s'.format(DB.__name__, median(rate)))
+speedup = median(rates[PooledDB]) / median(rates[UnpooledDB])
+print('   speedup: {:.2f}x'.format(speedup))
+
+server.shutdown()
@@ -0,0 +1,12 @@
+# %% Imports
+
+from statcast.database.bbsavant import DB as SavantDB
+from statcast.database.gd_scoreboards import DB as ScoreboardDB
+from statcast.database.gamecalendar import GameCalendar
+
+
+# %% Update scoreboards, then Savant data, skipping days without games
+
+calendar = GameCalendar()
+calendar.loadScoreboards(ScoreboardDB())
+savantDB = SavantDB(calendar=calendar)
@@ -7,6 +7,7 @@ from sklearn.base import clone
 
 from .database.bbsavant import DB as SavantDB
 from .database.gd_weather import DB as WeatherDB
+from .database.database import concatFrames
 
 from .better.randomforest import TreeSelectingRFRegressor
 from .better.mixed import BetterLME4
@@ -18,9 +19,7 @@ from . import __path__
 
 savantDB = SavantDB('fast')
 weatherDB = WeatherDB('fast')
-weatherData = pd.read_sql_query(
-    '''SELECT *
-    FROM {}'''.format(weatherDB._tblName), weatherDB.engine)
+weatherData = weatherDB.query(columns=['game_pk', 'temp'], compact=True)
 
 _storagePath = os.path.join(__path__[0], 'data')
 
@@ -84,38 +83,58 @@ class Bip():
     def _initData(self, years):
         '''Doc String'''
 
-        self.data = pd.DataFrame()
+        temps = pd.Series(weatherData.temp.values, index=weatherData.game_pk)
+        temps = temps[~temps.index.duplicated(keep='first')]
+
+        chunks = []
         for year in years:
-            rawD = pd.read_sql_query(
-                '''SELECT *
-                FROM {}
-                WHERE type = 'X'
-                AND game_year = {}
-                AND game_type = 'R ' '''.format(savantDB._tblName, year),
-                savantDB.engine)
-            self.data = self.data.append(rawD, ignore_index=True)
-
-        self.data['sprayAngle'] = \
-            (np.arctan2(208 - self.data.hc_y, self.data.hc_x - 128) /
+            if savantDB.hasMirror():
+                rawD = savantDB.readMirror(filters=[('game_year', '=', year),
+                                                    ('type', '=', 'X'),
+                                                    ('game_type', '=', 'R ')],
+                                           compact=True)
+                rawD = rawD[(rawD.type == 'X') & (rawD.game_type == 'R ')]
+                chunks.append(self._chunkFeatures(rawD, temps))
+            else:
+                chunks.extend(
+                    self._chunkFeatures(rawD, temps)
+                    for rawD in savantDB.iterQuery(
+                        filters=[('type', '=', 'X'),
+                                 ('game_year', '=', year),
+                                 ('game_type', '=', 'R ')],
+                        compact=True))
+        self.data = concatFrames(chunks)
+
+        self._dataFeatures()
+
+    @staticmethod
+    def _chunkFeatures(chunk, temps):
+        '''Doc String'''
+
+        chunk['sprayAngle'] = \
+            (np.arctan2(208 - chunk.hc_y, chunk.hc_x - 128) /
              (2 * np.pi) * 360 + 90) % 360 - 180
-        self.data['hitDistanceGD'] = np.sqrt((self.data.hc_x - 128) ** 2 +
-                                             (208 - self.data.hc_y) ** 2)
+        chunk['hitDistanceGD'] = np.sqrt((chunk.hc_x - 128) ** 2 +
+                                         (208 - chunk.hc_y) ** 2)
 
-        self.data[['on_3b', 'on_2b', 'on_1b']] = \
-            self.data[['on_3b', 'on_2b', 'on_1b']]. \
+        chunk[['on_3b', 'on_2b', 'on_1b']] = \
+            chunk[['on_3b', 'on_2b', 'on_1b']]. \
             fillna(value=0).astype('int')
-        self.data['baseState'] = \
-            (self.data[['on_3b', 'on_2b', 'on_1b']] == 0). \
+        chunk['baseState'] = \
+            (chunk[['on_3b', 'on_2b', 'on_1b']] == 0). \
             replace([True, False], ['_', 'X']).sum(axis=1)
 
-        temps = pd.Series(weatherData.temp.values, index=weatherData.game_pk)
-        temps = temps[~temps.index.duplicated(keep='first')]
-        self.data['gdTemp'] = temps.loc[self.data.game_pk].values
+        chunk['gdTemp'] = temps.reindex(chunk.game_pk).values
 
         excludeEvents = ['Batter Interference', 'Hit By Pitch', 'Strikeout',
                          'Walk', 'Fan Intereference', 'Field Error',
                          'Catcher Interference', 'Fan interference']
-        self.data['exclude'] = self.data.events.isin(excludeEvents)
+        chunk['exclude'] = chunk.events.isin(excludeEvents)
+
+        return chunk
+
+    def _dataFeatures(self):
+        '''Doc String'''
 
         categories = ['pitch_type', 'batter', 'pitcher', 'events', 'zone',
                       'stand', 'p_throws', 'home_team', 'away_team',
@@ -1,10 +1,14 @@
-import time
+import io
+import threading
 import datetime as dt
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
 
 import pandas as pd
 import sqlalchemy as sa
 
 from .database import Database
+from .retry import FetchError
 
 
 _string = sa.types.String
@@ -43,8 +47,8 @@ distance_gt=&
 distance_lt=&
 batted_ball_angle_gt=&
 batted_ball_angle_lt=&
-game_date_gt={date}&
-game_date_lt={date}&
+game_date_gt={start}&
+game_date_lt={end}&
 team=&
 position=&
 hfRO=&
@@ -101,6 +105,8 @@ _venues = [
     'CWS',
     'NYY']
 
+_venueAliases = {'FLA': 'MIA', 'ANA': 'LAA'}
+
 
 class DB(Database):
     '''Doc String'''
@@ -113,6 +119,19 @@ class DB(Database):
     _drivername = 'postgresql'
     startDate = dt.date(2008, 1, 1)
     _itemKeyName = 'game_pk'
+    _tblIndexes = {'year_type': ('game_year', 'type', 'game_type'),
+                   'game_date': ('game_date',)}
+    _mirrorPartitions = ('game_year', 'game_date')
+    _tblCategories = ('pitch_type', 'events', 'description', 'game_type',
+                      'stand', 'p_throws', 'home_team', 'away_team', 'type',
+                      'inning_topbot')
+    _venueWorkers = 8
+    _dateWorkers = 2
+    _poolMaxSize = _venueWorkers * _dateWorkers
+    _baseURL = _baseURL
+    _rowCap = 40000
+    _windowDays = 7
+    _windowCache = 4
     _tblDTypes = dict(
         pitch_type=_string,
         pitch_id=_integer,
@@ -175,33 +194,124 @@ class DB(Database):
         release_extension=_float,
         game_pk=_integer)
 
+    def __init__(self, *args, **kwargs):
+        '''Doc string'''
+
+        self._windows = OrderedDict()
+        self._windowLock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _getCSV(self, start, end, v=''):
+        '''Doc string'''
+
+        url = self._baseURL.format(start=start, end=end, venue=v)
+        (status, content) = self._get(url, end)
+        if status != 200:
+            raise FetchError('Received {} status code while trying to '
+                             'download {} {} to {}'.
+                             format(status, v or 'all venues', start, end))
+
+        try:
+            with self.metrics.timer('parse', end) as counts:
+                data = pd.read_csv(io.BytesIO(content),
+                                   parse_dates=['game_date'],
+                                   na_values='null')
+                counts['rows'] = len(data)
+        except Exception as e:
+            raise FetchError('Unable to parse {} {} to {}, {!r} occurred.'.
+                             format(v or 'all venues', start, end, e)) from e
+        return data
+
+    def _update(self, *args, **kwargs):
+        '''Doc string'''
+
+        with self._windowLock:
+            self._windows.clear()
+        super()._update(*args, **kwargs)
+
+    def _getVenue(self, d, v):
+        '''Doc string'''
+
+        return self._getCSV(d, d, v)
+
+    def _getRange(self, start, end):
+        '''Doc string'''
+
+        data = self._getCSV(start, end)
+        if len(data) < self._rowCap:
+            return data
+
+        if start < end:
+            mid = start + dt.timedelta((end - start).days // 2)
+            self.logger.info('Row cap reached for {} to {}, splitting dates'.
+                             format(start, end))
+            datas = [self._getRange(start, mid),
+                     self._getRange(mid + dt.timedelta(1), end)]
+        else:
+            self.logger.info('Row cap reached for {}, splitting venues'.
+                             format(start))
+            with ThreadPoolExecutor(max_workers=self._venueWorkers) as \
+                    executor:
+                datas = list(executor.map(lambda v: self._getVenue(start, v),
+                                          self._getVenues(start)))
+
+        datas = [data for data in datas if not data.empty]
+        if not datas:
+            return pd.DataFrame()
+        return pd.concat(datas, ignore_index=True)
+
+    def _getWindow(self, start):
+        '''Doc string'''
+
+        with self._windowLock:
+            future = self._windows.get(start)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._windows[start] = future
+                while len(self._windows) > self._windowCache:
+                    self._windows.popitem(last=False)
+
+        if owner:
+            end = start + dt.timedelta(self._windowDays - 1)
+            try:
+                future.set_result(self._getRange(start, end))
+            except Exception as e:
+                with self._windowLock:
+                    self._windows.pop(start, None)
+                future.set_exception(e)
+
+        return future.result()
+
+    def _getVenues(self, d):
+        '''Doc string'''
+
+        if self.calendar is None:
+            return _venues
+        dayVenues = self.calendar.venues(d)
+        if dayVenues is None:
+            return _venues
+
+        dayVenues = {_venueAliases.get(v, v) for v in dayVenues}
+        if not dayVenues.issubset(_venues):
+            return _venues
+        return [v for v in _venues if v in dayVenues]
+
     def _getItems(self, d):
         '''Doc string'''
 
         items = []
         itemKeys = []
-        for v in _venues:
-            for dummy in range(100):
-                try:
-                    data = pd.read_csv(_baseURL.format(date=d, venue=v),
-                                       parse_dates=[2],
-                                       na_values='null')
-                except Exception as e:
-                    self.logger.debug(
-                        '{!r} occurred while trying to dowload {} {}.'.
-                        format(e, v, d))
-                    time.sleep(5)
-                else:
-                    if not data.empty:
-                        game_pks = data.game_pk.unique()
-                        itemKeys.extend(game_pks)
-                        for game_pk in game_pks:
-                            items.append(data.iloc[
-                                data.game_pk.values == game_pk, :])
-                    break
-            else:
-                self.logger.error(
-                    'Unable to download {} {} after {} attempts.'.
-                    format(v, d, dummy + 1))
+
+        start = d - dt.timedelta(d.toordinal() % self._windowDays)
+        data = self._getWindow(start)
+        if data.empty:
+            return (items, itemKeys)
+
+        data = data.iloc[(data.game_date.dt.date == d).values, :]
+        game_pks = data.game_pk.unique()
+        itemKeys.extend(game_pks)
+        for game_pk in game_pks:
+            items.append(data.iloc[data.game_pk.values == game_pk, :])
 
         return (items, itemKeys)
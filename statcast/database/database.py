@@ -1,5 +1,13 @@
 import logging
 import abc
+import io
+import os
+import csv
+import json
+import shutil
+import hashlib
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from pathlib import Path
 import datetime as dt
@@ -7,8 +15,14 @@ import datetime as dt
 import numpy as np
 import pandas as pd
 import sqlalchemy as sa
+import requests
+from pandas.api.types import CategoricalDtype, union_categoricals, \
+    is_numeric_dtype, is_bool_dtype, is_float_dtype
 
 from ..tools.fixpath import findFile
+from .retry import RetryPolicy, RetryBudgetError, FetchError
+from .rawcache import RawCache
+from .metrics import RunMetrics
 
 
 _string = sa.types.String
@@ -18,6 +32,110 @@ _date = sa.types.Date
 _binary = sa.types.Binary
 
 
+def _tableName(table):
+    '''Doc String'''
+
+    if table.schema:
+        return '"{}"."{}"'.format(table.schema, table.name)
+    return '"{}"'.format(table.name)
+
+
+def _copyRows(conn, tableName, keys, dataIter):
+    '''Doc String'''
+
+    dbapiConn = conn.connection
+    with dbapiConn.cursor() as cur:
+        buf = io.StringIO()
+        csv.writer(buf).writerows(dataIter)
+        buf.seek(0)
+
+        columns = ', '.join('"{}"'.format(k) for k in keys)
+        cur.copy_expert('COPY {} ({}) FROM STDIN WITH CSV'.
+                        format(tableName, columns), buf)
+
+
+def _copyInsert(table, conn, keys, dataIter):
+    '''Doc String'''
+
+    _copyRows(conn, _tableName(table), keys, dataIter)
+
+
+def _scalar(value):
+    '''Doc String'''
+
+    return np.asarray(value).item()
+
+
+def _checkInt(elem):
+    '''Doc String'''
+
+    if isinstance(elem, float) and not elem.is_integer():
+        raise ValueError('{} is not an integer'.format(elem))
+    return int(elem)
+
+
+def _hashItem(item):
+    '''Doc String'''
+
+    item = item.apply(lambda col: col.astype('float64')
+                      if is_numeric_dtype(col) and not is_bool_dtype(col)
+                      else col)
+    h = hashlib.sha1()
+    h.update(','.join(str(col) for col in item.columns).encode())
+    h.update(pd.util.hash_pandas_object(item, index=False).values.tobytes())
+    return h.hexdigest()
+
+
+_sqlOps = {'=': '=', '==': '=', '!=': '<>', '<': '<', '<=': '<=', '>': '>',
+           '>=': '>=', 'in': 'IN', 'not in': 'NOT IN'}
+
+
+def concatFrames(frames):
+    '''Doc String'''
+
+    frames = list(frames)
+    if not frames:
+        return pd.DataFrame()
+
+    for col in frames[0].columns:
+        if not isinstance(frames[0][col].dtype, CategoricalDtype):
+            continue
+        categories = union_categoricals(
+            [frame[col] for frame in frames
+             if isinstance(frame[col].dtype, CategoricalDtype)]).categories
+        for frame in frames:
+            frame[col] = frame[col].astype(CategoricalDtype(categories))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def _orderedMap(executor, func, args, window):
+    '''Doc String'''
+
+    futures = deque()
+    try:
+        for arg in args:
+            futures.append(executor.submit(func, arg))
+            if len(futures) >= window:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def makeSession(poolConnections=10, poolMaxSize=32):
+    '''Doc String'''
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=poolConnections,
+                                            pool_maxsize=poolMaxSize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class Database(metaclass=abc.ABCMeta):
     '''Doc String'''
 
@@ -28,6 +146,34 @@ class Database(metaclass=abc.ABCMeta):
     _tblName = 'raw'
     _updtTblName = 'updates'
     _updtTblDTypes = {'cmd': _string, 'dateFrom': _date, 'dateTo': _date}
+    _doneTblName = 'dates'
+    _doneTblDTypes = {'date': _date, 'items': _integer,
+                      'completed': sa.types.DateTime}
+    _itemTblName = 'items'
+    _itemKeys = None
+    _retryAttempts = 8
+    _retryBase = 0.5
+    _retryCap = 60
+    _retryBudget = 500
+    _retryRatio = 0.1
+    _retryStatuses = (408, 429)
+    _breakerThreshold = 10
+    _breakerCooldown = 300
+    _poolConnections = 10
+    _poolMaxSize = 32
+    _timeout = 60
+    _cacheRaw = False
+    _cacheOnly = False
+    _cacheLag = 7
+    _batchDates = 1
+    _dateWorkers = min(8, os.cpu_count() or 1)
+    _checkpointDates = 30
+    _tblIndexes = {}
+    _autoIndex = True
+    _mirrorPartitions = None
+    _chunkSize = 50000
+    _keyChunk = 500
+    _tblCategories = ()
 
     @abc.abstractmethod
     def _drivername():
@@ -53,9 +199,15 @@ class Database(metaclass=abc.ABCMeta):
     def _getItems(self, date):
         pass
 
-    def __init__(self, fast=False):
+    def __init__(self, fast=False, cacheRaw=None, cacheOnly=None,
+                 calendar=None):
         '''Doc string'''
 
+        if cacheRaw is not None:
+            self._cacheRaw = cacheRaw
+        if cacheOnly is not None:
+            self._cacheOnly = cacheOnly
+
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG)
 
@@ -67,16 +219,35 @@ class Database(metaclass=abc.ABCMeta):
         sH.setFormatter(fmt)
         self.logger.addHandler(sH)
 
+        self.metrics = RunMetrics()
+        self.failedDates = set()
+        self.retry = RetryPolicy(attempts=self._retryAttempts,
+                                 base=self._retryBase,
+                                 cap=self._retryCap,
+                                 budget=self._retryBudget,
+                                 ratio=self._retryRatio,
+                                 threshold=self._breakerThreshold,
+                                 cooldown=self._breakerCooldown,
+                                 logger=self.logger)
+        self.session = makeSession(poolConnections=self._poolConnections,
+                                   poolMaxSize=self._poolMaxSize)
+        self.calendar = calendar
+
         # Local database
         if self._host is None:
-            dbPath = findFile(self.dbName + '.db')
-            if not dbPath:
+            try:
+                dbPath = findFile(self.dbName + '.db')
+            except FileNotFoundError:
                 dbPath = self.dbName + '.db'
             logPath = str(Path(dbPath).with_name(self.dbName + '.log'))
         else:
             dbPath = self.dbName
             logPath = self.dbName + '.log'
 
+        self.dataDir = Path(logPath).resolve().parent
+        self.rawCache = RawCache(self.dataDir / 'rawcache')
+        self.mirrorDir = self.dataDir / (self.dbName + '_parquet')
+
         fH = logging.FileHandler(logPath)
         fH.setLevel(logging.DEBUG)
         fH.setFormatter(fmt)
@@ -106,10 +277,13 @@ class Database(metaclass=abc.ABCMeta):
                 tempConnection.execute('commit')
                 tempConnection.execute(
                         'create database "{}"'.format(self.dbName))
-                self._init0()
-                return
 
-        if not self.engine.has_table(self._tblName):
+        if not self.engine.has_table(self._tblName) or \
+                not self.engine.has_table(self._updtTblName):
+            if fast:
+                self.lastUpdate = self.startDate
+                self.doneDates = None
+                return
             self._init0()
             return
 
@@ -119,13 +293,12 @@ class Database(metaclass=abc.ABCMeta):
             self.engine, parse_dates=['dateTo']).dateTo.iloc[0].date()
 
         if fast:
-            self.itemKeys = None
+            self.doneDates = None
             return
 
-        self.itemKeys = list(pd.read_sql_query(
-            'SELECT DISTINCT "{}" FROM "{}"'.format(self._itemKeyName,
-                                                self._tblName),
-            self.engine)[self._itemKeyName])
+        self._loadProgress()
+        if self._autoIndex:
+            self.buildIndexes()
 
         if not self.lastUpdate == dt.date.today():
             self.update()
@@ -134,65 +307,430 @@ class Database(metaclass=abc.ABCMeta):
         '''Doc string'''
 
         self.logger.info('Initializing database')
-        self.itemKeys = []
+        self._loadProgress()
+        if self.doneDates:
+            self.logger.info('Resuming from {} completed dates'.
+                             format(len(self.doneDates)))
 
-        self._update(self.startDate)
+        self._update(self.startDate, deferIndexes=True)
 
-    def _addItem(self, item, itemKey, replace=False):
+    def _loadProgress(self):
+        '''Doc string'''
+
+        self._itemKeys = None
+
+        if self.engine.has_table(self._doneTblName):
+            self.doneDates = set(pd.read_sql_query(
+                'SELECT "date" FROM "{}"'.format(self._doneTblName),
+                self.engine, parse_dates=['date'])['date'].dt.date)
+        else:
+            self.doneDates = set()
+
+    @property
+    def itemKeys(self):
+        '''Doc string'''
+
+        if self._itemKeys is None:
+            if not self.engine.has_table(self._itemTblName):
+                self._initManifest()
+            if self.engine.has_table(self._itemTblName):
+                self._itemKeys = set(pd.read_sql_query(
+                    'SELECT "itemKey" FROM "{}"'.format(self._itemTblName),
+                    self.engine).itemKey)
+            else:
+                self._itemKeys = set()
+        return self._itemKeys
+
+    def _itemTblDTypes(self):
+        '''Doc string'''
+
+        return {'itemKey': self._tblDTypes[self._itemKeyName],
+                'date': _date,
+                'nRows': _integer,
+                'hash': _string,
+                'ingested': sa.types.DateTime}
+
+    def _initManifest(self):
+        '''Doc string'''
+
+        if not self.engine.has_table(self._tblName):
+            return
+
+        self.logger.info('Building item manifest from {}'.
+                         format(self._tblName))
+        manifest = pd.read_sql_query(
+            'SELECT "{0}" AS "itemKey", COUNT(*) AS "nRows" FROM "{1}" '
+            'GROUP BY "{0}"'.format(self._itemKeyName, self._tblName),
+            self.engine)
+        manifest['date'] = None
+        manifest['hash'] = None
+        manifest['ingested'] = dt.datetime.now()
+        manifest.to_sql(self._itemTblName, self.engine, if_exists='append',
+                        index=False, dtype=self._itemTblDTypes())
+
+    def _request(self, url):
+        '''Doc String'''
+
+        r = self.session.get(url, timeout=self._timeout)
+        if r.status_code >= 500 or r.status_code in self._retryStatuses:
+            r.raise_for_status()
+        return (r.status_code, r.content)
+
+    def _get(self, url, d=None):
+        '''Doc String'''
+
+        cache = self._cacheRaw and d is not None and \
+            (dt.date.today() - d).days > self._cacheLag
+        if cache:
+            cached = self.rawCache.get(url)
+            if cached is not None:
+                self.metrics.add('download', d, cacheHits=1,
+                                 bytes=len(cached[1]))
+                return cached
+            if self._cacheOnly:
+                raise FetchError('{} is not in the raw cache'.format(url))
+
+        attempts = [0]
+
+        def request(url):
+            attempts[0] += 1
+            return self._request(url)
+
+        with self.metrics.timer('download', d) as counts:
+            try:
+                (status, content) = self.retry.call(request, url)
+            except RetryBudgetError:
+                raise
+            except Exception as e:
+                raise FetchError('Unable to download {}, {!r} occurred.'.
+                                 format(url, e)) from e
+            finally:
+                counts['requests'] = 1
+                counts['retries'] = max(attempts[0] - 1, 0)
+            counts['bytes'] = len(content)
+        if cache and status in (200, 404):
+            self.rawCache.put(url, content, status)
+
+        return (status, content)
+
+    def _indexDefs(self):
         '''Doc String'''
 
+        indexes = OrderedDict()
+        indexes['itemkey'] = (self._itemKeyName,)
+        indexes.update(self._tblIndexes)
+        return indexes
+
+    def buildIndexes(self):
+        '''Doc String'''
+
+        if not self.engine.has_table(self._tblName):
+            return
+
+        if self.engine.has_table(self._itemTblName):
+            self.engine.execute(
+                'CREATE INDEX IF NOT EXISTS "{0}_date" ON "{0}" ("date")'.
+                format(self._itemTblName))
+
+        for name, cols in self._indexDefs().items():
+            self.logger.debug('Building index {} on {}'.format(name, cols))
+            self.engine.execute(
+                'CREATE INDEX IF NOT EXISTS "{0}_{1}" ON "{0}" ({2})'.
+                format(self._tblName, name,
+                       ', '.join('"{}"'.format(col) for col in cols)))
+
+    def dropIndexes(self):
+        '''Doc String'''
+
+        for name in self._indexDefs():
+            self.engine.execute('DROP INDEX IF EXISTS "{}_{}"'.
+                                format(self._tblName, name))
+
+    def _itemHashes(self, itemKeys):
+        '''Doc String'''
+
+        hashes = {}
+        if not self.engine.has_table(self._itemTblName):
+            return hashes
+
+        select = sa.text('SELECT "itemKey", "hash" FROM "{}" '
+                         'WHERE "itemKey" IN :itemKeys'.
+                         format(self._itemTblName)). \
+            bindparams(sa.bindparam('itemKeys', expanding=True))
+        for ii in range(0, len(itemKeys), self._keyChunk):
+            hashes.update(self.engine.execute(
+                select, itemKeys=itemKeys[ii:ii + self._keyChunk]).fetchall())
+        return hashes
+
+    def _writeItems(self, items, manifest, replace=False, dates=()):
+        '''Doc String'''
+
+        itemKeys = list(manifest.itemKey)
+        with self.engine.begin() as conn:
+            if items:
+                self._writeData(conn, pd.concat(items, ignore_index=True),
+                                itemKeys, replace)
+                manifest.to_sql(self._itemTblName, conn, if_exists='append',
+                                index=False, dtype=self._itemTblDTypes())
+            if dates:
+                if self.engine.has_table(self._doneTblName):
+                    self._deleteKeys(conn, self._doneTblName, 'date',
+                                     [d for (d, nItems) in dates])
+                done = pd.DataFrame(list(dates), columns=['date', 'items'])
+                done['completed'] = dt.datetime.now()
+                done.to_sql(self._doneTblName, conn, if_exists='append',
+                            index=False, dtype=self._doneTblDTypes)
+
+        self.itemKeys.update(itemKeys)
+        self.doneDates.update(d for (d, nItems) in dates)
+
+    def _writeData(self, conn, data, itemKeys, replace=False):
+        '''Doc String'''
+
+        if self._drivername == 'postgresql':
+            method = _copyInsert
+        else:
+            method = None
+
         if replace:
-            self._rmItem(itemKey)
+            self._rmItems(itemKeys, conn)
+        data = self._formatData(data)
+        data.to_sql(self._tblName, conn, if_exists='append', index=False,
+                    dtype=self._tblDTypes, method=method)
+
+    def _formatData(self, data):
+        '''Doc String'''
+
+        ints = {}
+        for col, sqlType in self._tblDTypes.items():
+            if sqlType is _integer and col in data and \
+                    is_float_dtype(data[col]):
+                try:
+                    ints[col] = data[col].astype('Int64')
+                except (TypeError, ValueError):
+                    pass
+        return data.assign(**ints) if ints else data
+
+    def _addItem(self, item, itemKey, replace=False):
+        '''Doc String'''
+
+        self._addItems([item], [itemKey], replace)
+
+    def _addItems(self, items, itemKeys, replace=False, dates=()):
+        '''Doc String'''
+
+        itemDates = [d for (d, nItems) in dates for ii in range(nItems)]
+        if len(itemDates) != len(items):
+            itemDates = [None] * len(items)
+        itemKeys = [_scalar(itemKey) for itemKey in itemKeys]
+        storedKeys = self.itemKeys
+
+        if not replace:
+            new = [ii for ii, itemKey in enumerate(itemKeys)
+                   if itemKey not in storedKeys]
+            items = [items[ii] for ii in new]
+            itemKeys = [itemKeys[ii] for ii in new]
+            itemDates = [itemDates[ii] for ii in new]
+
+        d = dates[-1][0] if dates else None
+        hashes = [_hashItem(item) for item in items]
+
+        if replace and items:
+            stored = self._itemHashes(itemKeys)
+            changed = [ii for ii, (itemKey, h) in
+                       enumerate(zip(itemKeys, hashes))
+                       if stored.get(itemKey) != h]
+            if len(changed) < len(items):
+                self.logger.debug('Skipping {} unchanged items'.
+                                  format(len(items) - len(changed)))
+                self.metrics.add('write', d,
+                                 skipped=len(items) - len(changed))
+                items = [items[ii] for ii in changed]
+                itemKeys = [itemKeys[ii] for ii in changed]
+                itemDates = [itemDates[ii] for ii in changed]
+                hashes = [hashes[ii] for ii in changed]
+
+        if not items and not dates:
+            return
+
+        manifest = pd.DataFrame({'itemKey': itemKeys,
+                                 'date': itemDates,
+                                 'nRows': [len(item) for item in items],
+                                 'hash': hashes,
+                                 'ingested': dt.datetime.now()},
+                                columns=['itemKey', 'date', 'nRows', 'hash',
+                                         'ingested'])
+        nRows = int(manifest.nRows.sum())
 
         try:
-            item.to_sql(self._tblName, self.engine, if_exists='append',
-                        index=False, dtype=self._tblDTypes)
+            with self.metrics.timer('write', d) as counts:
+                self._writeItems(items, manifest, replace, dates)
+                counts['rows'] = nRows
         except Exception as e:
-            bads = self._checkItem(item)
-            if not bads:
+            fixed = False
+            with self.metrics.timer('check', d) as counts:
+                for (item, itemKey) in zip(items, itemKeys):
+                    bads = self._checkItem(item)
+                    if bads:
+                        self._fixItem(item, bads, itemKey)
+                        fixed = True
+                counts['rows'] = nRows
+            if not fixed:
                 raise e
-            else:
-                self._fixItem(item, bads, itemKey)
 
-            item.to_sql(self._tblName, self.engine, if_exists='append',
-                        index=False, dtype=self._tblDTypes)
+            with self.metrics.timer('write', d) as counts:
+                self._writeItems(items, manifest, replace, dates)
+                counts['rows'] = nRows
 
-        self.itemKeys.append(itemKey)
+    def _fetchItems(self, d):
+        '''Doc string'''
+
+        if self.calendar is not None and self.calendar.hasGames(d) is False:
+            return ([], [])
+        return self._getItems(d)
 
     def _addDate(self, d, replace=False):
         '''Doc string'''
 
-        (items, itemKeys) = self._getItems(d)
-        for (item, itemKey) in zip(items, itemKeys):
-            self._addItem(item, itemKey, replace)
+        (items, itemKeys) = self._fetchItems(d)
+        self._addItems(items, itemKeys, replace, [(d, len(itemKeys))])
 
-    def _addDates(self, dates, replace=False):
+    def _fetchDate(self, d):
         '''Doc string'''
 
-        for date in dates:
-            self._addDate(date, replace)
+        try:
+            return self._fetchItems(d)
+        except FetchError as e:
+            return e
+
+    def _failDate(self, d, e):
+        '''Doc string'''
 
-    def _addDateRng(self, start, end=dt.date.today(), step=1, replace=False):
+        self.logger.error('Unable to fetch items for {}, {!r} occurred. '
+                          'The date will be retried on the next update.'.
+                          format(d, e))
+        self.failedDates.add(d)
+
+    def _addDates(self, dates, replace=False, workers=None, onDurable=None):
+        '''Doc string'''
+
+        if workers is None:
+            workers = self._dateWorkers
+        if not replace:
+            dates = [date for date in dates if date not in self.doneDates]
+
+        items = []
+        itemKeys = []
+        done = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = _orderedMap(executor, self._fetchDate, dates,
+                                  2 * workers)
+            for ii, (date, result) in enumerate(zip(dates, fetched), 1):
+                if isinstance(result, FetchError):
+                    self._failDate(date, result)
+                else:
+                    (dateItems, dateItemKeys) = result
+                    items.extend(dateItems)
+                    itemKeys.extend(dateItemKeys)
+                    done.append((date, len(dateItemKeys)))
+                if ii % self._batchDates == 0 or ii == len(dates):
+                    if done:
+                        self._addItems(items, itemKeys, replace, done)
+                    items = []
+                    itemKeys = []
+                    done = []
+                    if onDurable is not None:
+                        onDurable(date)
+
+    def _addDateRng(self, start, end=dt.date.today(), step=1, replace=False,
+                    workers=None, onDurable=None):
         '''Doc string'''
 
         dates = [start + dt.timedelta(ii)
                  for ii in range(0, (end - start).days, step)]
-        self._addDates(dates, replace)
+        self._addDates(dates, replace, workers, onDurable)
 
-    def _rmItem(self, itemKey):
+    def _rmItems(self, itemKeys, conn=None):
         '''Doc String'''
 
-        self.engine.execute('DELETE FROM "{}" WHERE "{}" = {}'.
-                            format(self._tblName, self._itemKeyName, itemKey))
-        if itemKey in self.itemKeys:
-            self.itemKeys.remove(itemKey)
+        if conn is None:
+            with self.engine.begin() as conn:
+                self._rmItems(itemKeys, conn)
+            self.itemKeys.difference_update(_scalar(itemKey)
+                                            for itemKey in itemKeys)
+            return
+
+        if self.engine.has_table(self._tblName):
+            self._deleteKeys(conn, self._tblName, self._itemKeyName,
+                             itemKeys)
+        self._rmManifest(itemKeys, conn)
+
+    def _rmManifest(self, itemKeys, conn):
+        '''Doc String'''
+
+        if self.engine.has_table(self._itemTblName):
+            self._deleteKeys(conn, self._itemTblName, 'itemKey', itemKeys)
+
+    def _deleteKeys(self, conn, tblName, keyName, itemKeys):
+        '''Doc String'''
+
+        itemKeys = [_scalar(itemKey) for itemKey in itemKeys]
+        delete = sa.text('DELETE FROM "{}" WHERE "{}" IN :itemKeys'.
+                         format(tblName, keyName)). \
+            bindparams(sa.bindparam('itemKeys', expanding=True))
+        for ii in range(0, len(itemKeys), self._keyChunk):
+            conn.execute(delete,
+                         itemKeys=itemKeys[ii:ii + self._keyChunk])
+
+    def _rmItem(self, itemKey, conn=None):
+        '''Doc String'''
+
+        self._rmItems([itemKey], conn)
+
+    def _dateItemKeys(self, d):
+        '''Doc String'''
+
+        if not self.engine.has_table(self._itemTblName) or \
+                not self.engine.has_table(self._doneTblName):
+            return None
+
+        done = self.engine.execute(
+            sa.text('SELECT "items" FROM "{}" WHERE "date" = :d '
+                    'ORDER BY "completed" DESC LIMIT 1'.
+                    format(self._doneTblName)), d=d).fetchone()
+        if done is None:
+            return None
+
+        itemKeys = [row[0] for row in self.engine.execute(
+            sa.text('SELECT "itemKey" FROM "{}" WHERE "date" = :d'.
+                    format(self._itemTblName)), d=d)]
+        if len(itemKeys) != done[0]:
+            return None
+        return itemKeys
 
     def _rmDate(self, d):
         '''Doc String'''
 
-        (items, itemKeys) = self._getItems(d)
-        for itemKey in itemKeys:
-            self._rmItem(itemKey)
+        itemKeys = self._dateItemKeys(d)
+        if itemKeys is None:
+            (items, itemKeys) = self._getItems(d)
+
+        with self.engine.begin() as conn:
+            if len(itemKeys):
+                self._rmItems(itemKeys, conn)
+            if self.engine.has_table(self._doneTblName):
+                conn.execute(
+                    sa.text('DELETE FROM "{}" WHERE "date" = :d'.
+                            format(self._doneTblName)), d=d)
+        self.itemKeys.difference_update(_scalar(itemKey)
+                                        for itemKey in itemKeys)
+        self.doneDates.discard(d)
+
+        if self._mirrorPartitions is not None and self.hasMirror():
+            state = self._mirrorState()
+            state['removed'] = sorted(set(state.get('removed', [])) |
+                                      {d.isoformat()})
+            self._saveMirrorState(state)
 
     def _rmDates(self, dates):
         '''Doc String'''
@@ -210,6 +748,9 @@ class Database(metaclass=abc.ABCMeta):
     def _addUpdate(self, cmd, dateFrom, dateTo):
         '''Doc String'''
 
+        if self.failedDates:
+            dateTo = max(dateFrom, min(dateTo, min(self.failedDates)))
+
         if self.engine.has_table(self._updtTblName):
             count = self.engine.execute(
                     'SELECT COUNT(*) FROM "{}"'.format(self._updtTblName)). \
@@ -224,16 +765,53 @@ class Database(metaclass=abc.ABCMeta):
                       dtype=self._updtTblDTypes)
         self.lastUpdate = dateTo
 
-    def _update(self, start, end=dt.date.today(), replaceStart=False):
+    def _update(self, start, end=dt.date.today(), replaceStart=False,
+                deferIndexes=False):
         '''Doc String'''
 
+        self.retry.reset()
+        self.metrics.reset()
+        self.failedDates.clear()
+        if deferIndexes:
+            self.dropIndexes()
+        durable = [0]
+
+        def checkpoint(d):
+            durable[0] += 1
+            if durable[0] % self._checkpointDates == 0:
+                self._addUpdate('update', start, d + dt.timedelta(1))
+
         if replaceStart:
-            self._rmDate(start)
+            self._addDates([start], replace=True)
+            self._addDateRng(start + dt.timedelta(1), end,
+                             onDurable=checkpoint)
+        else:
+            self._addDateRng(start, end, onDurable=checkpoint)
+        self._finishUpdate(start, end)
+
+    def _finishUpdate(self, start, end):
+        '''Doc String'''
 
-        self._addDateRng(start, end)
         self._addUpdate('update', start, end)
+        if self._autoIndex:
+            self.buildIndexes()
+        if self._mirrorPartitions is not None and self.hasMirror():
+            self.syncMirror()
+        self._writeReport(start, end)
         self.logger.info('Updated database')
 
+    def _writeReport(self, start, end):
+        '''Doc String'''
+
+        path = self.dataDir / 'reports' / '{}_{:%Y%m%dT%H%M%S}'.format(
+            self.dbName, self.metrics.started)
+        try:
+            self.metrics.write(path, dbName=self.dbName, dateFrom=start,
+                               dateTo=end)
+        except OSError as e:
+            self.logger.warning('Unable to write run report {}, {!r} '
+                                'occurred.'.format(path, e))
+
     def update(self):
         '''Doc String'''
 
@@ -243,6 +821,220 @@ class Database(metaclass=abc.ABCMeta):
 
         self._update(self.lastUpdate, replaceStart=True)
 
+    def hasMirror(self):
+        '''Doc String'''
+
+        return (self.mirrorDir / '_mirror.json').exists()
+
+    def _mirrorState(self):
+        '''Doc String'''
+
+        with (self.mirrorDir / '_mirror.json').open() as f:
+            return json.load(f)
+
+    def _saveMirrorState(self, state):
+        '''Doc String'''
+
+        self.mirrorDir.mkdir(parents=True, exist_ok=True)
+        with (self.mirrorDir / '_mirror.json').open('w') as f:
+            json.dump(state, f)
+
+    def syncMirror(self, full=False):
+        '''Doc String'''
+
+        if self._mirrorPartitions is None:
+            raise ValueError(
+                '{} does not define _mirrorPartitions'.format(self.dbName))
+
+        syncTime = dt.datetime.now()
+        dateCol = self._mirrorPartitions[-1]
+        state = self._mirrorState() if self.hasMirror() else {}
+        removed = [pd.Timestamp(d).date()
+                   for d in state.get('removed', [])]
+
+        if full or not state:
+            dates = pd.read_sql_query(
+                'SELECT DISTINCT "{}" FROM "{}"'.format(dateCol,
+                                                        self._tblName),
+                self.engine, parse_dates=[dateCol])[dateCol].dt.date
+        else:
+            synced = pd.Timestamp(state['synced'])
+            done = pd.read_sql_query(
+                'SELECT "date", "completed" FROM "{}"'.
+                format(self._doneTblName),
+                self.engine, parse_dates=['date', 'completed'])
+            dates = done.date[done.completed >= synced].dt.date
+
+        dates = sorted(set(dates.dropna()) | set(removed))
+        for d in dates:
+            self._writePartition(d)
+
+        self._saveMirrorState({'synced': syncTime.isoformat()})
+        self.logger.info('Synced {} dates to {}'.format(len(dates),
+                                                        self.mirrorDir))
+
+    def _writePartition(self, d):
+        '''Doc String'''
+
+        dateCol = self._mirrorPartitions[-1]
+        pattern = '/'.join(['*'] * (len(self._mirrorPartitions) - 1) +
+                           ['{}={}'.format(dateCol, d.isoformat())])
+        for path in self.mirrorDir.glob(pattern):
+            shutil.rmtree(str(path))
+            for parent in path.parents:
+                if parent == self.mirrorDir or any(parent.iterdir()):
+                    break
+                parent.rmdir()
+
+        data = pd.read_sql_query(
+            sa.text('SELECT * FROM "{}" WHERE "{}" = :d'.
+                    format(self._tblName, dateCol)),
+            self.engine, params={'d': d},
+            parse_dates=[k for k, v in self._tblDTypes.items()
+                         if v == _date])
+
+        partitions = list(self._mirrorPartitions)
+        for values, part in data.groupby(partitions):
+            if not isinstance(values, tuple):
+                values = (values,)
+            partDir = self.mirrorDir
+            for col, value in zip(partitions, values):
+                if isinstance(value, pd.Timestamp):
+                    value = value.date().isoformat()
+                partDir = partDir / '{}={}'.format(col, value)
+            partDir.mkdir(parents=True, exist_ok=True)
+            part.drop(partitions, axis=1).to_parquet(
+                str(partDir / 'part-0.parquet'), engine='pyarrow',
+                index=False)
+
+    def readMirror(self, columns=None, filters=None, compact=False,
+                   float32=False):
+        '''Doc String'''
+
+        data = pd.read_parquet(str(self.mirrorDir), engine='pyarrow',
+                               columns=columns, filters=filters)
+
+        for col in self._mirrorPartitions:
+            if col not in data:
+                continue
+            if self._tblDTypes[col] is _date:
+                data[col] = pd.to_datetime(data[col].astype(str))
+            elif self._tblDTypes[col] is _integer:
+                data[col] = data[col].astype(np.int64)
+            else:
+                data[col] = data[col].astype(str)
+
+        data = data.loc[:, [col for col in self._tblDTypes if col in data]]
+        if compact or float32:
+            data = self._castFrame(data, compact, float32)
+        return data
+
+    def _buildQuery(self, columns=None, filters=None):
+        '''Doc String'''
+
+        if columns is None:
+            columns = list(self._tblDTypes)
+        if filters is None:
+            filters = []
+
+        unknown = [col for col in list(columns) + [f[0] for f in filters]
+                   if col not in self._tblDTypes]
+        if unknown:
+            raise ValueError('Unknown columns {} for table {}'.
+                             format(unknown, self._tblName))
+
+        clauses = []
+        params = {}
+        for ii, (col, op, value) in enumerate(filters):
+            if op not in _sqlOps:
+                raise ValueError('Unsupported filter operator {!r}'.
+                                 format(op))
+            if op in ('in', 'not in') and not len(value):
+                clauses.append('1 = 0' if op == 'in' else '1 = 1')
+            elif op in ('in', 'not in'):
+                names = []
+                for jj, elem in enumerate(value):
+                    names.append(':p{}_{}'.format(ii, jj))
+                    params['p{}_{}'.format(ii, jj)] = _scalar(elem)
+                clauses.append('"{}" {} ({})'.format(col, _sqlOps[op],
+                                                     ', '.join(names)))
+            else:
+                params['p{}'.format(ii)] = _scalar(value)
+                clauses.append('"{}" {} :p{}'.format(col, _sqlOps[op], ii))
+
+        sql = 'SELECT {} FROM "{}"'.format(
+            ', '.join('"{}"'.format(col) for col in columns), self._tblName)
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+
+        return (sa.text(sql), params, list(columns))
+
+    def _castFrame(self, data, compact=False, float32=False):
+        '''Doc String'''
+
+        for col in data.columns:
+            sqlType = self._tblDTypes.get(col)
+            if sqlType is _date:
+                data[col] = pd.to_datetime(data[col])
+            elif sqlType is _integer and not data[col].isnull().any():
+                if compact:
+                    data[col] = pd.to_numeric(data[col], downcast='integer')
+                else:
+                    data[col] = data[col].astype(np.int64)
+            elif sqlType is _float or sqlType is _integer:
+                if float32:
+                    data[col] = data[col].astype(np.float32)
+                else:
+                    data[col] = data[col].astype(np.float64)
+            elif compact and col in self._tblCategories:
+                data[col] = data[col].astype('category')
+        return data
+
+    def query(self, columns=None, filters=None, chunksize=None,
+              compact=False, float32=False):
+        '''Doc String'''
+
+        if chunksize is not None:
+            return self.iterQuery(columns, filters, chunksize, compact,
+                                  float32)
+
+        (sql, params, columns) = self._buildQuery(columns, filters)
+        dateCols = [col for col in columns if self._tblDTypes[col] is _date]
+
+        return self._castFrame(pd.read_sql_query(
+            sql, self.engine, params=params, parse_dates=dateCols),
+            compact, float32)
+
+    def iterQuery(self, columns=None, filters=None, chunksize=None,
+                  compact=False, float32=False):
+        '''Doc String'''
+
+        if chunksize is None:
+            chunksize = self._chunkSize
+
+        (sql, params, columns) = self._buildQuery(columns, filters)
+        dateCols = [col for col in columns if self._tblDTypes[col] is _date]
+
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(stream_results=True)
+            for chunk in pd.read_sql_query(sql, conn, params=params,
+                                           parse_dates=dateCols,
+                                           chunksize=chunksize):
+                yield self._castFrame(chunk, compact, float32)
+
+    def foldQuery(self, func, combine, initial=None, columns=None,
+                  filters=None, chunksize=None):
+        '''Doc String'''
+
+        result = initial
+        for chunk in self.iterQuery(columns, filters, chunksize):
+            value = func(chunk)
+            if result is None:
+                result = value
+            else:
+                result = combine(result, value)
+        return result
+
     def loadItem(self, itemKey):
         '''Doc String'''
 
@@ -250,11 +1042,7 @@ class Database(metaclass=abc.ABCMeta):
             print('Item key {} not found in database'.format(itemKey))
             return pd.DataFrame()
 
-        return pd.read_sql_query(
-            'SELECT * FROM "{}" WHERE "{}" = {}'.format(
-                self._tblName, self._itemKeyName, itemKey),
-            self.engine, parse_dates=[k for k, v in self._tblDTypes.items()
-                                      if v == _date])
+        return self.query(filters=[(self._itemKeyName, '=', itemKey)])
 
     def _checkItem(self, item):
         '''Doc String'''
@@ -262,26 +1050,50 @@ class Database(metaclass=abc.ABCMeta):
         bads = []
         for col, sqlType in self._tblDTypes.items():
             ser = item.loc[:, col]
-            if sqlType is _string:
-                checkFunc = str
+            if sqlType is _string or sqlType is _binary:
+                continue
             elif sqlType is _integer:
-                checkFunc = int
+                checkFunc = _checkInt
             elif sqlType is _float:
                 checkFunc = float
             elif sqlType is _date:
                 checkFunc = pd.to_datetime
-            elif sqlType is _binary:
-                checkFunc = bool
             else:
                 raise TypeError('An invalid datatype {} was supplied for '
                                 'column {}'.format(sqlType, col))
-            for ind, elem in ser.iloc[~(ser.isnull().values)].items():
+
+            suspects = ser.notnull().values & ~self._passes(ser, sqlType)
+            for ind, elem in ser.iloc[suspects].items():
                 try:
                     checkFunc(elem)
                 except Exception as e:
                     bads.append((ind, col, e))
         return bads
 
+    @staticmethod
+    def _passes(ser, sqlType):
+        '''Doc String'''
+
+        try:
+            if sqlType is _date:
+                return pd.to_datetime(ser, errors='coerce').notnull().values
+
+            numeric = pd.to_numeric(ser, errors='coerce')
+            if sqlType is _float:
+                return numeric.notnull().values
+
+            values = numeric.values.astype(float)
+            finite = np.isfinite(values)
+            finite[finite] = values[finite] == np.floor(values[finite])
+            if ser.dtype != object:
+                return finite
+            isStr = ser.str.len().notnull().values
+            isInt = ser.str.match(r'\s*[-+]?\d+\s*$').fillna(False).values
+        except (AttributeError, TypeError, ValueError):
+            return np.zeros(len(ser), dtype=bool)
+
+        return np.where(isStr, isInt.astype(bool), finite)
+
     def _fixItem(self, item, bads, itemKey):
         '''Doc String'''
 
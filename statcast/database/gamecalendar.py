@@ -0,0 +1,86 @@
+import threading
+
+import pandas as pd
+
+from .scoreboard import _baseurl, getGames
+
+
+class GameCalendar():
+    '''Doc String'''
+
+    def __init__(self, get=None, baseURL=_baseurl):
+        '''Doc String'''
+
+        self._get = get
+        self._baseURL = baseURL
+        self._venues = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, d):
+        '''Doc String'''
+
+        return d in self._venues
+
+    def add(self, d, venues):
+        '''Doc String'''
+
+        with self._lock:
+            self._venues[d] = frozenset(venues)
+
+    def loadScoreboards(self, scoreboardDB):
+        '''Doc String'''
+
+        engine = scoreboardDB.engine
+        if engine.has_table(scoreboardDB._doneTblName):
+            done = pd.read_sql_query(
+                'SELECT "date" FROM "{}" WHERE "items" = 0'.
+                format(scoreboardDB._doneTblName),
+                engine, parse_dates=['date'])
+            for d in done['date'].dt.date:
+                self.add(d, ())
+
+        games = scoreboardDB.query(columns=['gameday', 'home_name_abbrev'])
+        games['date'] = pd.to_datetime(games.gameday.str[:10],
+                                       format='%Y_%m_%d', errors='coerce')
+        games = games.dropna(subset=['date'])
+        for d, venues in games.groupby(games['date'].dt.date):
+            self.add(d, venues.home_name_abbrev.dropna())
+
+    def _probe(self, d):
+        '''Doc String'''
+
+        try:
+            (status, games) = getGames(self._get, d, self._baseURL)
+        except Exception:
+            return None
+
+        if status == 404:
+            return frozenset()
+        if status != 200:
+            return None
+
+        return frozenset(game.attrib.get('home_name_abbrev')
+                         for game in games)
+
+    def venues(self, d):
+        '''Doc String'''
+
+        with self._lock:
+            if d in self._venues:
+                return self._venues[d]
+
+        if self._get is None:
+            return None
+
+        venues = self._probe(d)
+        if venues is not None:
+            self.add(d, venues)
+        return venues
+
+    def hasGames(self, d):
+        '''Doc String'''
+
+        venues = self.venues(d)
+        if venues is None:
+            return None
+        return len(venues) > 0
@@ -1,4 +1,5 @@
 import datetime as dt
+from collections import OrderedDict
 
 import xml.etree.ElementTree as ET
 
@@ -22,6 +23,8 @@ class DB(GdDatabase):
     dbName = 'gdGameEvents'
     startDate = dt.date(2008, 1, 1)
     _fileName = 'game_events.xml'
+    _tblCategories = ('inning_topbot', 'entry', 'events', 'pitch_des',
+                      'pitch_type', 'type')
     _tblDTypes = dict(
         game_pk=_integer,
         inning=_integer,
@@ -60,52 +63,72 @@ class DB(GdDatabase):
     def _parseFile(self, file, itemKey):
         '''Doc string'''
 
-        rowDict1 = dict.fromkeys(self._tblDTypes.keys(), np.nan)
+        columns = OrderedDict()
+        nRows = 0
 
-        tree = ET.parse(file)
-        root = tree.getroot()
-        innings = root.findall('inning')
+        def addRow(rowDict):
+            nonlocal nRows
+            for key in rowDict:
+                if key not in columns:
+                    columns[key] = [np.nan] * nRows
+            for key, col in columns.items():
+                col.append(rowDict.get(key, np.nan))
+            nRows += 1
+
+        rowDict1 = OrderedDict.fromkeys(self._tblDTypes.keys(), np.nan)
         rowDict1[self._itemKeyName] = itemKey
-        df = pd.DataFrame()
-        for inning in innings:
-            rowDict1['inning'] = inning.get('num')
-            for innHalf in inning:
-                if innHalf.tag == 'top':
-                    rowDict1['inning_topbot'] = 'top'
-                else:
-                    rowDict1['inning_topbot'] = 'bot'
-                for entry in innHalf:
-                    rowDict2 = rowDict1.copy()
-                    rowDict2['entry'] = entry.tag
-                    rowDict2['tfs'] = entry.attrib.pop('start_tfs', np.nan)
-                    rowDict2['tfs_zulu'] = \
-                        entry.attrib.pop('start_tfs_zulu', np.nan)
-                    rowDict2['events'] = \
-                        '::'.join(entry.attrib.pop(key)
-                                  for key in sorted(tuple(entry.attrib.keys()))
-                                  if 'event' in key and
-                                  not key.endswith(('_es', '_num')))
-                    rowDict2['events_es'] = \
-                        '::'.join(entry.attrib.pop(key)
-                                  for key in sorted(tuple(entry.attrib.keys()))
-                                  if 'event' in key and
-                                  key.endswith('_es'))
-                    rowDict2.update(entry.attrib)
-                    pitches = entry.findall('pitch')
-                    if entry.tag == 'atbat' and len(pitches) > 0:
-                        for pitch in pitches:
-                            rowDict3 = rowDict2.copy()
-                            rowDict3['pitch_des'] = \
-                                pitch.attrib.pop('des', np.nan)
-                            rowDict3['pitch_des_es'] = \
-                                pitch.attrib.pop('des_es', np.nan)
-                            rowDict3.update(pitch.attrib)
-                            df = df.append(pd.DataFrame(rowDict3, index=(0,)),
-                                           ignore_index=True)
+
+        parents = []
+        for event, elem in ET.iterparse(file, events=('start', 'end')):
+            if event == 'start':
+                parents.append(elem)
+                depth = len(parents)
+                if depth == 2 and elem.tag == 'inning':
+                    rowDict1['inning'] = elem.get('num')
+                elif depth == 3 and parents[1].tag == 'inning':
+                    if elem.tag == 'top':
+                        rowDict1['inning_topbot'] = 'top'
                     else:
-                        df = df.append(pd.DataFrame(rowDict2, index=(0,)),
-                                       ignore_index=True)
+                        rowDict1['inning_topbot'] = 'bot'
+                continue
+
+            depth = len(parents)
+            parents.pop()
+            if depth == 4 and parents[1].tag == 'inning':
+                entry = elem
+                rowDict2 = rowDict1.copy()
+                rowDict2['entry'] = entry.tag
+                rowDict2['tfs'] = entry.attrib.pop('start_tfs', np.nan)
+                rowDict2['tfs_zulu'] = \
+                    entry.attrib.pop('start_tfs_zulu', np.nan)
+                rowDict2['events'] = \
+                    '::'.join(entry.attrib.pop(key)
+                              for key in sorted(tuple(entry.attrib.keys()))
+                              if 'event' in key and
+                              not key.endswith(('_es', '_num')))
+                rowDict2['events_es'] = \
+                    '::'.join(entry.attrib.pop(key)
+                              for key in sorted(tuple(entry.attrib.keys()))
+                              if 'event' in key and
+                              key.endswith('_es'))
+                rowDict2.update(entry.attrib)
+                pitches = entry.findall('pitch')
+                if entry.tag == 'atbat' and len(pitches) > 0:
+                    for pitch in pitches:
+                        rowDict3 = rowDict2.copy()
+                        rowDict3['pitch_des'] = \
+                            pitch.attrib.pop('des', np.nan)
+                        rowDict3['pitch_des_es'] = \
+                            pitch.attrib.pop('des_es', np.nan)
+                        rowDict3.update(pitch.attrib)
+                        addRow(rowDict3)
+                else:
+                    addRow(rowDict2)
+            if 1 < depth <= 4:
+                elem.clear()
+                parents[-1].remove(elem)
 
+        df = pd.DataFrame(columns, columns=list(columns))
         df.replace('', np.nan, inplace=True)
         return df
 
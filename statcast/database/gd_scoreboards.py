@@ -1,13 +1,10 @@
-import io
-
 import datetime as dt
-import xml.etree.ElementTree as ET
 
-import requests
 import pandas as pd
 import sqlalchemy as sa
 
 from .database import Database
+from .scoreboard import _baseurl, fetchGames
 
 
 _string = sa.types.String
@@ -16,11 +13,6 @@ _float = sa.types.Float
 _date = sa.types.Date
 _binary = sa.types.Binary
 
-_baseURL = \
-    'http://gd2.mlb.com/components/game/mlb/year_{yyyy}/month_{mm}/day_{dd}/{}'
-
-dailyScoreboard = 'master_scoreboard.xml'
-
 
 class DB(Database):
     '''Doc String'''
@@ -28,11 +20,16 @@ class DB(Database):
     dbName = 'gdScoreboardGames'
     startDate = dt.date(2008, 1, 1)
     _itemKeyName = 'game_pk'
+    _tblCategories = ('away_code', 'away_division', 'away_name_abbrev',
+                      'game_type', 'home_code', 'home_division',
+                      'home_name_abbrev', 'league', 'status', 'time_zone',
+                      'venue')
     _username = 'matt'
     _password = 'gratitude'
     _host = 'baseball.cxx9lqfsabek.us-west-2.rds.amazonaws.com'
     _port = 5432
     _drivername = 'postgresql'
+    _baseURL = _baseurl
     _tblDTypes = dict(
         ampm=_string,
         aw_lg_ampm=_string,
@@ -138,28 +135,21 @@ class DB(Database):
         items = []
         itemKeys = []
 
-        r = requests.get(_baseURL.format(dailyScoreboard,
-                                         yyyy=d.strftime('%Y'),
-                                         mm=d.strftime('%m'),
-                                         dd=d.strftime('%d')))
-        if r.status_code != 200:
-            return (items, itemKeys)
-
-        tree = ET.parse(io.StringIO(r.text))
-        root = tree.getroot()
-        games = root.findall('game')
+        games = fetchGames(self._get, d, self._baseURL)
         rowDict1 = dict.fromkeys(self._tblDTypes.keys())
 
-        for game in games:
-            itemKey = int(game.attrib['game_pk'])
-            rowDict2 = rowDict1.copy()
-            rowDict2.update(game.attrib)
-            status = game.find('status')
-            if status:
-                rowDict2.update(status.attrib)
-            df = pd.DataFrame(rowDict2, index=(0,))
-
-            itemKeys.append(itemKey)
-            items.append(df)
+        with self.metrics.timer('parse', d) as counts:
+            for game in games:
+                itemKey = int(game.attrib['game_pk'])
+                rowDict2 = rowDict1.copy()
+                rowDict2.update(game.attrib)
+                status = game.find('status')
+                if status:
+                    rowDict2.update(status.attrib)
+                df = pd.DataFrame(rowDict2, index=(0,))
+
+                itemKeys.append(itemKey)
+                items.append(df)
+            counts['rows'] = len(items)
 
         return (items, itemKeys)
@@ -19,6 +19,7 @@ class DB(GdDatabase):
     dbName = 'gdWeather'
     startDate = dt.date(2008, 1, 1)
     _fileName = 'plays.xml'
+    _tblCategories = ('condition',)
     _tblDTypes = dict(
         condition=_string,
         temp=_integer,
@@ -28,9 +29,19 @@ class DB(GdDatabase):
     def _parseFile(self, file, itemKey):
         '''Doc string'''
 
-        tree = ET.parse(file)
-        root = tree.getroot()
-        weather = root.find('weather').attrib
+        depth = 0
+        for event, elem in ET.iterparse(file, events=('start', 'end')):
+            if event == 'end':
+                depth -= 1
+                elem.clear()
+                continue
+            depth += 1
+            if depth == 2 and elem.tag == 'weather':
+                weather = elem.attrib
+                break
+        else:
+            raise ValueError('No weather element found for {} = {}'.
+                             format(self._itemKeyName, itemKey))
 
         df = pd.DataFrame({'condition': weather['condition'],
                            'temp': int(weather['temp']),
@@ -0,0 +1,111 @@
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+
+from .database import _orderedMap
+from .retry import FetchError
+from .scoreboard import fetchGames
+
+
+class GdCrawler():
+    '''Doc String'''
+
+    _dateWorkers = 2
+    _gameWorkers = 8
+
+    def __init__(self, dbs):
+        '''Doc String'''
+
+        self.dbs = list(dbs)
+        if not self.dbs:
+            raise ValueError('GdCrawler needs at least one database')
+
+        self.logger = self.dbs[0].logger
+        self._starts = None
+        for db in self.dbs:
+            if db.doneDates is None:
+                db._loadProgress()
+
+    def _getItems(self, d):
+        '''Doc string'''
+
+        db0 = self.dbs[0]
+        results = [([], []) for db in self.dbs]
+
+        try:
+            games = fetchGames(db0._get, d, db0._baseURL)
+        except FetchError as e:
+            return [e for db in self.dbs]
+
+        tasks = [(ii, db, game)
+                 for game in games for (ii, db) in enumerate(self.dbs)
+                 if self._wants(ii, d)]
+        with ThreadPoolExecutor(max_workers=self._gameWorkers) as executor:
+            fetched = executor.map(
+                lambda task: self._getGame(task[1], d, task[2]), tasks)
+            for (ii, db, game), result in zip(tasks, fetched):
+                if isinstance(results[ii], FetchError) or result is None:
+                    continue
+                if isinstance(result, FetchError):
+                    results[ii] = result
+                else:
+                    results[ii][1].append(result[0])
+                    results[ii][0].append(result[1])
+
+        return results
+
+    def _wants(self, ii, d):
+        '''Doc string'''
+
+        if self._starts is None:
+            return True
+        dbStart = self._starts[ii]
+        return d == dbStart or \
+            (d > dbStart and d not in self.dbs[ii].doneDates)
+
+    def _getGame(self, db, d, game):
+        '''Doc string'''
+
+        try:
+            return db._getGame(d, game)
+        except FetchError as e:
+            return e
+
+    def update(self, end=None):
+        '''Doc String'''
+
+        if end is None:
+            end = dt.date.today()
+        starts = [db.lastUpdate for db in self.dbs]
+        self._starts = starts
+        start = min(starts)
+        dates = [start + dt.timedelta(ii)
+                 for ii in range((end - start).days)]
+        dates = [d for d in dates
+                 if any(self._wants(ii, d) for ii in range(len(self.dbs)))]
+
+        for db in self.dbs:
+            db.retry.reset()
+            db.metrics.reset()
+            db.failedDates.clear()
+
+        with ThreadPoolExecutor(max_workers=self._dateWorkers) as executor:
+            fetched = _orderedMap(executor, self._getItems, dates,
+                                  2 * self._dateWorkers)
+            for nn, (d, results) in enumerate(zip(dates, fetched), 1):
+                for ii, (db, dbStart, result) in \
+                        enumerate(zip(self.dbs, starts, results)):
+                    if not self._wants(ii, d):
+                        continue
+                    replace = d == dbStart
+                    if isinstance(result, FetchError):
+                        db._failDate(d, result)
+                    else:
+                        (items, itemKeys) = result
+                        db._addItems(items, itemKeys, replace,
+                                     [(d, len(itemKeys))])
+                    if nn % db._checkpointDates == 0:
+                        db._addUpdate('update', dbStart,
+                                      d + dt.timedelta(1))
+
+        for db, dbStart in zip(self.dbs, starts):
+            db._finishUpdate(dbStart, end)
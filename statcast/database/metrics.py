@@ -0,0 +1,100 @@
+import csv
+import json
+import time
+import threading
+import datetime as dt
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+_counters = ('seconds', 'requests', 'retries', 'cacheHits', 'bytes', 'rows',
+             'skipped')
+
+
+class RunMetrics():
+    '''Doc String'''
+
+    def __init__(self):
+        '''Doc String'''
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        '''Doc String'''
+
+        with self._lock:
+            self._stages = OrderedDict()
+            self.started = dt.datetime.now()
+            self._t0 = time.perf_counter()
+
+    def add(self, stage, d=None, **counts):
+        '''Doc String'''
+
+        with self._lock:
+            row = self._stages.setdefault((d, stage),
+                                          dict.fromkeys(_counters, 0))
+            for key, value in counts.items():
+                row[key] += value
+
+    @contextmanager
+    def timer(self, stage, d=None):
+        '''Doc String'''
+
+        counts = {}
+        t0 = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            self.add(stage, d, seconds=time.perf_counter() - t0, **counts)
+
+    def rows(self):
+        '''Doc String'''
+
+        with self._lock:
+            return [OrderedDict([('date', d), ('stage', stage)] +
+                                list(row.items()))
+                    for (d, stage), row in self._stages.items()]
+
+    def totals(self):
+        '''Doc String'''
+
+        totals = OrderedDict()
+        for row in self.rows():
+            total = totals.setdefault(row['stage'],
+                                      dict.fromkeys(_counters, 0))
+            for key in _counters:
+                total[key] += row[key]
+        return totals
+
+    def report(self, **info):
+        '''Doc String'''
+
+        elapsed = time.perf_counter() - self._t0
+        totals = self.totals()
+        written = totals.get('write', {}).get('rows', 0)
+        fetched = totals.get('download', {}).get('bytes', 0)
+
+        report = OrderedDict(info)
+        report['started'] = self.started.isoformat()
+        report['finished'] = dt.datetime.now().isoformat()
+        report['elapsed'] = elapsed
+        report['dates'] = len({row['date'] for row in self.rows()
+                               if row['date'] is not None})
+        report['rowsPerSecond'] = written / elapsed if elapsed else None
+        report['bytesPerSecond'] = fetched / elapsed if elapsed else None
+        report['stages'] = totals
+        return report
+
+    def write(self, path, **info):
+        '''Doc String'''
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(str(path.with_suffix('.json')), 'w') as f:
+            json.dump(self.report(**info), f, indent=2, default=str)
+
+        with open(str(path.with_suffix('.csv')), 'w', newline='') as f:
+            writer = csv.DictWriter(f, ('date', 'stage') + _counters)
+            writer.writeheader()
+            writer.writerows(self.rows())
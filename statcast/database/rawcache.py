@@ -0,0 +1,59 @@
+import os
+import gzip
+import hashlib
+import tempfile
+
+from pathlib import Path
+
+
+class RawCache():
+    '''Doc String'''
+
+    def __init__(self, path):
+        '''Doc String'''
+
+        self.path = Path(path)
+
+    def _filePath(self, url, status=200):
+        '''Doc String'''
+
+        key = hashlib.sha1(url.encode()).hexdigest()
+        suffix = '.gz' if status == 200 else '.{}'.format(status)
+        return self.path / key[:2] / (key + suffix)
+
+    def __contains__(self, url):
+        '''Doc String'''
+
+        return self._filePath(url).exists() or \
+            self._filePath(url, 404).exists()
+
+    def get(self, url):
+        '''Doc String'''
+
+        try:
+            with gzip.open(str(self._filePath(url)), 'rb') as f:
+                return (200, f.read())
+        except (OSError, EOFError):
+            pass
+
+        if self._filePath(url, 404).exists():
+            return (404, b'')
+        return None
+
+    def put(self, url, content, status=200):
+        '''Doc String'''
+
+        if status not in (200, 404):
+            raise ValueError('Only 200 and 404 responses can be cached')
+
+        filePath = self._filePath(url, status)
+        filePath.parent.mkdir(parents=True, exist_ok=True)
+        (fd, tempPath) = tempfile.mkstemp(dir=str(filePath.parent))
+        with os.fdopen(fd, 'wb') as f:
+            if status == 200:
+                f.write(gzip.compress(content))
+        os.replace(tempPath, str(filePath))
+        if status == 200:
+            missing = self._filePath(url, 404)
+            if missing.exists():
+                missing.unlink()
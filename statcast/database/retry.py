@@ -0,0 +1,141 @@
+import time
+import random
+import threading
+
+from urllib.parse import urlparse
+
+
+class RetryBudgetError(Exception):
+    '''Doc String'''
+    pass
+
+
+class FetchError(Exception):
+    '''Doc String'''
+    pass
+
+
+class RetryPolicy():
+    '''Doc String'''
+
+    def __init__(self, attempts=8, base=0.5, cap=60, budget=500, ratio=0.1,
+                 threshold=10, cooldown=300, logger=None):
+        '''Doc String'''
+
+        self.attempts = attempts
+        self.base = base
+        self.cap = cap
+        self.budget = budget
+        self.ratio = ratio
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.logger = logger
+
+        self._cond = threading.Condition()
+        self.reset()
+
+    def reset(self):
+        '''Doc String'''
+
+        with self._cond:
+            self.retries = 0
+            self._tokens = self.budget
+            self._failures = {}
+            self._openUntil = {}
+            self._probing = set()
+            self._cond.notify_all()
+
+    def backoff(self, attempt):
+        '''Doc String'''
+
+        return random.uniform(0, min(self.cap, self.base * 2 ** attempt))
+
+    def _acquire(self, host):
+        '''Doc String'''
+
+        with self._cond:
+            while True:
+                openUntil = self._openUntil.get(host)
+                if openUntil is None:
+                    return False
+                wait = openUntil - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                elif host not in self._probing:
+                    self._probing.add(host)
+                    return True
+                else:
+                    self._cond.wait()
+
+    def _success(self, host, probe=False):
+        '''Doc String'''
+
+        with self._cond:
+            self._failures[host] = 0
+            if self.budget is not None:
+                self._tokens = min(self.budget, self._tokens + self.ratio)
+            if probe:
+                self._openUntil.pop(host, None)
+                if self.logger is not None:
+                    self.logger.info('Closed circuit for {}'.format(host))
+                self._cond.notify_all()
+
+    def _failure(self, host, probe=False):
+        '''Doc String'''
+
+        with self._cond:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if probe or failures >= self.threshold:
+                self._openUntil[host] = time.monotonic() + self.cooldown
+                if self.logger is not None:
+                    self.logger.warning(
+                        'Opened circuit for {} after {} consecutive '
+                        'failures, pausing requests for {} seconds'.
+                        format(host, failures, self.cooldown))
+                self._cond.notify_all()
+
+    def _release(self, host):
+        '''Doc String'''
+
+        with self._cond:
+            self._probing.discard(host)
+            self._cond.notify_all()
+
+    def _spend(self):
+        '''Doc String'''
+
+        with self._cond:
+            if self.budget is not None and self._tokens < 1:
+                raise RetryBudgetError(
+                    'Retry budget exhausted after {} retries'.
+                    format(self.retries))
+            if self.budget is not None:
+                self._tokens -= 1
+            self.retries += 1
+
+    def call(self, func, url, *args, **kwargs):
+        '''Doc String'''
+
+        host = urlparse(url).netloc
+        for attempt in range(self.attempts):
+            probe = self._acquire(host)
+            try:
+                result = func(url, *args, **kwargs)
+            except Exception as e:
+                self._failure(host, probe)
+                error = e
+            else:
+                self._success(host, probe)
+                return result
+            finally:
+                if probe:
+                    self._release(host)
+
+            if self.logger is not None:
+                self.logger.debug('{!r} occurred while trying to dowload {}.'.
+                                  format(error, url))
+            if attempt + 1 == self.attempts:
+                raise error
+            self._spend()
+            time.sleep(self.backoff(attempt))
@@ -0,0 +1,96 @@
+import io
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import xml.etree.ElementTree as ET
+
+from .retry import FetchError, RetryBudgetError
+
+
+_baseurl = \
+    'http://gd2.mlb.com/components/game/mlb/year_{yyyy}/month_{mm}/day_{dd}/{}'
+
+dailyScoreboard = 'master_scoreboard.xml'
+
+_cacheSize = 64
+_cacheTTL = 3600
+_cache = OrderedDict()
+_cacheLock = threading.Lock()
+
+
+def gdURL(d, fileName, baseURL=_baseurl):
+    '''Doc String'''
+
+    return baseURL.format(fileName,
+                          yyyy=d.strftime('%Y'),
+                          mm=d.strftime('%m'),
+                          dd=d.strftime('%d'))
+
+
+def parseGames(content):
+    '''Doc String'''
+
+    root = ET.parse(io.BytesIO(content)).getroot()
+    return root.findall('game')
+
+
+def getGames(get, d, baseURL=_baseurl):
+    '''Doc String'''
+
+    url = gdURL(d, dailyScoreboard, baseURL)
+
+    with _cacheLock:
+        entry = _cache.get(url)
+        if entry is not None and time.monotonic() - entry[0] > _cacheTTL:
+            entry = None
+        owner = entry is None
+        if owner:
+            entry = (time.monotonic(), Future())
+            _cache[url] = entry
+            while len(_cache) > _cacheSize:
+                _cache.popitem(last=False)
+        else:
+            _cache.move_to_end(url)
+
+    future = entry[1]
+    if owner:
+        try:
+            (status, content) = get(url, d)
+            games = parseGames(content) if status == 200 else []
+            future.set_result((status, games))
+        except Exception as e:
+            with _cacheLock:
+                if _cache.get(url) is entry:
+                    del _cache[url]
+            future.set_exception(e)
+
+    return future.result()
+
+
+def fetchGames(get, d, baseURL=_baseurl):
+    '''Doc String'''
+
+    url = gdURL(d, dailyScoreboard, baseURL)
+    try:
+        (status, games) = getGames(get, d, baseURL)
+    except (FetchError, RetryBudgetError):
+        raise
+    except Exception as e:
+        raise FetchError('Unable to download {}, {!r} occurred.'.
+                         format(url, e)) from e
+
+    if status == 404:
+        return []
+    if status != 200:
+        raise FetchError('Received {} status code while trying to download '
+                         '{}'.format(status, url))
+    return games
+
+
+def clearGames():
+    '''Doc String'''
+
+    with _cacheLock:
+        _cache.clear()